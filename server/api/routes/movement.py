@@ -7,7 +7,7 @@ from server.services.fitness_analyzer.movement_analysis import (
 router = APIRouter()
 
 @router.post("/analizza_frame/")
-async def analizza_frame(
+def analizza_frame(
     nome_esercizio: str = Body(...),
     keypoints: dict = Body(...)
 ):
@@ -5,20 +5,122 @@ This micro-service provides ML/AI endpoints that the main Node.js app can call.
 Handles computationally intensive ML operations using Python's ecosystem.
 """
 
+import time
+
+_import_started = time.perf_counter()
+
+import asyncio
+import logging
+import os
+import sys
+from contextlib import asynccontextmanager, suppress
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
 import uvicorn
-import os
-from datetime import datetime
+
+# Heavy dependencies (pandas, openai) are imported lazily, either on first use
+# or by the background warm-up task started in lifespan().
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from server.api.routes import movement
+
+logger = logging.getLogger("uvicorn.error")
+
+# Warm-up state, exposed by /health/ready
+startup_state: Dict[str, Any] = {
+    "status": "warming_up",
+    "import_seconds": None,
+    "warmup_seconds": None,
+    "steps": {},
+}
+
+def _preload_rules() -> Dict[str, Any]:
+    from server.services.fitness_analyzer.movement_analysis import carica_tabella_regole
+    return {"exercises": len(carica_tabella_regole())}
+
+def _preload_openai_client() -> Dict[str, Any]:
+    from server.services.fitness_analyzer.movement_analysis import carica_client_openai
+    carica_client_openai()
+    return {}
+
+# (name, loader, optional). A failing required step is "failed": it keeps
+# /health/ready at 503 and is retried with exponential backoff. A failing
+# optional step is "skipped" and does not block readiness: without an OpenAI
+# client valutazione_openai() already answers with its fallback feedback.
+WARMUP_STEPS = [
+    ("rules", _preload_rules, False),
+    ("openai_client", _preload_openai_client, True),
+]
+WARMUP_RETRY_SECONDS = 1.0
+WARMUP_RETRY_MAX_SECONDS = 60.0
+
+async def _run_step(name: str, step, optional: bool) -> bool:
+    """Run one warm-up step in a worker thread and record its outcome."""
+    step_started = time.perf_counter()
+    try:
+        details = await asyncio.to_thread(step)
+        status = "ok"
+    except Exception as e:
+        details = {"error": str(e)}
+        status = "skipped" if optional else "failed"
+    elapsed = round(time.perf_counter() - step_started, 3)
+    attempts = startup_state["steps"].get(name, {}).get("attempts", 0) + 1
+    startup_state["steps"][name] = {"status": status, "seconds": elapsed, "attempts": attempts, **details}
+    logger.info("Warm-up step %s: %s in %.3fs (attempt %d)", name, status, elapsed, attempts)
+    return status != "failed"
+
+async def run_warmup() -> None:
+    """Fill the caches used by /analizza_frame/, retrying failed required steps.
+
+    The status is "warming_up" until the first pass ends, then "degraded"
+    while some required step is still being retried, then "ready".
+    """
+    warmup_started = time.perf_counter()
+    pending = []
+    for name, step, optional in WARMUP_STEPS:
+        if not await _run_step(name, step, optional):
+            pending.append((name, step, optional))
+
+    delay = WARMUP_RETRY_SECONDS
+    while pending:
+        startup_state["status"] = "degraded"
+        await asyncio.sleep(delay)
+        pending = [entry for entry in pending if not await _run_step(*entry)]
+        delay = min(delay * 2, WARMUP_RETRY_MAX_SECONDS)
+
+    startup_state["warmup_seconds"] = round(time.perf_counter() - warmup_started, 3)
+    startup_state["status"] = "ready"
+    logger.info("Warm-up completed in %.3fs", startup_state["warmup_seconds"])
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logger.info("ML Services imported in %.3fs", startup_state["import_seconds"])
+    app.state.warmup_task = asyncio.create_task(run_warmup())
+    yield
+    # Cancelling stops pending retries; a step already running in its worker
+    # thread still finishes before the process exits.
+    app.state.warmup_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await app.state.warmup_task
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Fitness ML Services",
     description="Machine Learning micro-service for fitness form analysis",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+app.include_router(movement.router)
+
 # Data Models
 class MovementAnalysisRequest(BaseModel):
     exercise_name: str
@@ -43,11 +145,26 @@ class PoseDetectionResponse(BaseModel):
     confidence: float
     frame_count: int
 
-# Health Check
+# Health Checks
 @app.get("/health")
+@app.get("/health/live")
 async def health_check():
+    """Liveness: the process is up and serving requests."""
     return {"status": "healthy", "service": "ML Services", "timestamp": datetime.now()}
 
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness: warm-up has finished and every required cache is loaded."""
+    body = {
+        "status": startup_state["status"],
+        "service": "ML Services",
+        "import_seconds": startup_state["import_seconds"],
+        "warmup_seconds": startup_state["warmup_seconds"],
+        "steps": startup_state["steps"],
+        "timestamp": datetime.now().isoformat()
+    }
+    return JSONResponse(status_code=200 if startup_state["status"] == "ready" else 503, content=body)
+
 # Movement Analysis Endpoint
 @app.post("/analyze-movement", response_model=MovementAnalysisResponse)
 async def analyze_movement(request: MovementAnalysisRequest):
@@ -116,6 +233,8 @@ async def train_custom_model(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Training failed: {str(e)}")
 
+startup_state["import_seconds"] = round(time.perf_counter() - _import_started, 3)
+
 # Run the service
 if __name__ == "__main__":
     port = int(os.getenv("ML_SERVICE_PORT", "8001"))
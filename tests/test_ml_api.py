@@ -0,0 +1,132 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "server" / "ml_services"))
+
+pytest.importorskip("fastapi")
+from fastapi.testclient import TestClient
+
+import ml_api
+
+
+@pytest.fixture
+def fresh_state(monkeypatch):
+    monkeypatch.setitem(ml_api.startup_state, "status", "warming_up")
+    monkeypatch.setitem(ml_api.startup_state, "warmup_seconds", None)
+    monkeypatch.setitem(ml_api.startup_state, "steps", {})
+
+
+def _wait_for_warmup(client, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        response = client.get("/health/ready")
+        if response.json()["status"] != "warming_up":
+            return response
+        time.sleep(0.01)
+    pytest.fail("warm-up did not complete")
+
+
+def test_readiness_goes_from_503_to_200(monkeypatch, fresh_state):
+    release = threading.Event()
+    monkeypatch.setattr(ml_api, "WARMUP_STEPS", [("slow", lambda: release.wait(5) and {}, False)])
+
+    with TestClient(ml_api.app) as client:
+        assert client.get("/health/live").status_code == 200
+        response = client.get("/health/ready")
+        assert response.status_code == 503
+        assert response.json()["status"] == "warming_up"
+
+        release.set()
+        response = _wait_for_warmup(client)
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"
+        assert response.json()["steps"]["slow"]["status"] == "ok"
+
+
+def _missing_library():
+    raise ImportError("No module named 'missing'")
+
+
+def _broken_loader():
+    raise ValueError("broken")
+
+
+def test_step_status_mapping(monkeypatch, fresh_state):
+    monkeypatch.setattr(ml_api, "WARMUP_STEPS", [
+        ("ok", lambda: {"exercises": 3}, False),
+        ("missing_library", _missing_library, True),
+        ("broken", _broken_loader, True),
+    ])
+    with TestClient(ml_api.app) as client:
+        response = _wait_for_warmup(client)
+
+    steps = response.json()["steps"]
+    assert response.status_code == 200
+    assert steps["ok"]["status"] == "ok"
+    assert steps["ok"]["exercises"] == 3
+    assert steps["missing_library"]["status"] == "skipped"
+    assert steps["broken"]["status"] == "skipped"
+
+
+def test_failed_required_step_is_retried_until_ready(monkeypatch, fresh_state):
+    attempts = []
+
+    def flaky_loader():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ValueError("broken")
+        return {}
+
+    monkeypatch.setattr(ml_api, "WARMUP_STEPS", [("flaky", flaky_loader, False)])
+    monkeypatch.setattr(ml_api, "WARMUP_RETRY_SECONDS", 0.2)
+
+    with TestClient(ml_api.app) as client:
+        response = _wait_for_warmup(client)
+        assert response.status_code == 503
+        assert response.json()["status"] == "degraded"
+        assert response.json()["steps"]["flaky"]["status"] == "failed"
+
+        deadline = time.monotonic() + 5
+        while response.json()["status"] != "ready" and time.monotonic() < deadline:
+            time.sleep(0.05)
+            response = client.get("/health/ready")
+
+    assert response.status_code == 200
+    assert response.json()["steps"]["flaky"]["status"] == "ok"
+    assert response.json()["steps"]["flaky"]["attempts"] == 3
+
+
+def test_shutdown_cancels_pending_retries(monkeypatch, fresh_state):
+    monkeypatch.setattr(ml_api, "WARMUP_STEPS", [("broken", _broken_loader, False)])
+    monkeypatch.setattr(ml_api, "WARMUP_RETRY_SECONDS", 60)
+
+    started = time.monotonic()
+    with TestClient(ml_api.app) as client:
+        _wait_for_warmup(client)
+    assert time.monotonic() - started < 5
+    assert ml_api.app.state.warmup_task.cancelled()
+
+
+def test_preload_rules_reads_committed_asset():
+    pytest.importorskip("pandas")
+    assert ml_api._preload_rules() == {"exercises": 5}
+
+
+def test_analizza_frame_applies_rules(monkeypatch):
+    pytest.importorskip("pandas")
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    with TestClient(ml_api.app) as client:
+        response = client.post("/analizza_frame/", json={
+            "nome_esercizio": "squat",
+            "keypoints": {"knee_angle": 170, "hip_angle": 95, "back_angle": 100, "ankle_angle": 80},
+        })
+
+    body = response.json()
+    assert response.status_code == 200
+    assert [f["errore"] for f in body["feedback_bio"]] == ["knee_alignment"]
+    assert body["feedback_ai"] == "Valutazione AI non disponibile."
@@ -0,0 +1,19 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_import_does_not_load_pandas_or_openai():
+    pytest.importorskip("pandas")
+    pytest.importorskip("openai")
+    code = (
+        "import sys\n"
+        "import server.services.fitness_analyzer.movement_analysis\n"
+        "assert 'pandas' not in sys.modules, 'pandas'\n"
+        "assert 'openai' not in sys.modules, 'openai'\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, check=True)